@@ -11,19 +11,39 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import os
 import platform
 import shutil
 import socket
+import statistics
 import subprocess
 import sys
 import tempfile
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+# Optional orjson for faster history (de)serialization
+try:
+    import orjson
+
+    dump_json = orjson.dumps
+    load_json = orjson.loads
+except ImportError:
+
+    def dump_json(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    load_json = json.loads
 
 
 # ============================================================================
@@ -32,6 +52,18 @@ from typing import Optional
 
 HISTORY_FILE = Path(__file__).parent.parent / "benchmarks" / "history.jsonl"
 
+# rsync's minimum delta block size; smaller files are resent whole
+RSYNC_MIN_BLOCK_SIZE = 700
+
+# Files larger than this are written in chunks of this size
+WRITE_CHUNK_SIZE = 1 << 20
+
+# `--version` output keyed by binary path/mtime/size
+VERSION_CACHE_FILE = Path.home() / ".cache" / "sy-bench" / "versions.json"
+
+# Mount point of the macOS RAM disk created by --ramdisk
+RAMDISK_VOLUME = "sy_bench_ram"
+
 # Test scenarios
 SCENARIOS = {
     "small_files": {"files": 1000, "size_kb": 1, "dirs": 10},
@@ -50,29 +82,33 @@ SCENARIOS = {
 QUICK_SCENARIOS = {"small_files": {"files": 100, "size_kb": 1, "dirs": 5}}
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Result from a single benchmark run."""
 
     scenario: str
     tool: str
-    operation: str  # initial, incremental, delta
+    operation: str  # initial, incremental, delta, startup
     duration_ms: float
     files_count: int
     bytes_total: int
-    throughput_mbps: float = 0.0
-    files_per_sec: float = 0.0
     error: Optional[str] = None
 
-    def __post_init__(self):
-        if self.duration_ms > 0:
-            self.throughput_mbps = (self.bytes_total / 1_000_000) / (
-                self.duration_ms / 1000
-            )
-            self.files_per_sec = self.files_count / (self.duration_ms / 1000)
+    # Derived from the timing on access
+    @property
+    def throughput_mbps(self) -> float:
+        if self.duration_ms <= 0:
+            return 0.0
+        return (self.bytes_total / 1_000_000) / (self.duration_ms / 1000)
 
+    @property
+    def files_per_sec(self) -> float:
+        if self.duration_ms <= 0:
+            return 0.0
+        return self.files_count / (self.duration_ms / 1000)
 
-@dataclass
+
+@dataclass(slots=True)
 class BenchmarkRun:
     """A complete benchmark run with all scenarios."""
 
@@ -129,43 +165,77 @@ def get_system_info() -> dict:
 def get_git_info() -> dict:
     """Get current git commit info."""
     try:
-        commit = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent,
-        ).stdout.strip()
-
-        branch = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+        # One git process reports commit, branch and working tree state
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v2", "--branch"],
             capture_output=True,
             text=True,
             cwd=Path(__file__).parent.parent,
-        ).stdout.strip()
-
-        dirty = (
-            subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent.parent,
-            ).stdout.strip()
-            != ""
         )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr)
+
+        commit = branch = "unknown"
+        dirty = False
+        for line in result.stdout.splitlines():
+            if line.startswith("# branch.oid "):
+                commit = line.split()[2][:7]
+            elif line.startswith("# branch.head "):
+                branch = line.split()[2]
+                if branch == "(detached)":
+                    branch = "HEAD"
+            elif not line.startswith("#"):
+                dirty = True
 
         return {"commit": commit, "branch": branch, "dirty": dirty}
     except Exception:
         return {"commit": "unknown", "branch": "unknown", "dirty": True}
 
 
+def tool_version_output(binary: str) -> str:
+    """
+    Return `binary --version` stdout, cached by the resolved binary's
+    path, mtime and size so repeated runs skip the spawn.
+    Raises FileNotFoundError if the binary isn't in PATH.
+    """
+    path = shutil.which(binary)
+    if path is None:
+        raise FileNotFoundError(binary)
+
+    st = os.stat(path)
+    key = f"{path}:{st.st_mtime_ns}:{st.st_size}"
+
+    try:
+        cache = json.loads(VERSION_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        cache = {}
+
+    if key in cache:
+        return cache[key]
+
+    result = subprocess.run([path, "--version"], capture_output=True, text=True)
+    if result.returncode != 0:
+        # Don't remember a failure for the life of the binary
+        return result.stdout
+
+    # Entries for earlier builds of the same binary can never match again
+    cache = {k: v for k, v in cache.items() if k.rsplit(":", 2)[0] != path}
+    cache[key] = result.stdout
+    try:
+        VERSION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        VERSION_CACHE_FILE.write_text(json.dumps(cache))
+    except OSError:
+        pass
+    return result.stdout
+
+
 def get_version_info() -> dict:
     """Get tool versions."""
     info = {}
 
     # sy version
     try:
-        result = subprocess.run(["sy", "--version"], capture_output=True, text=True)
-        info["sy"] = result.stdout.strip().replace("sy ", "")
+        info["sy"] = tool_version_output("sy").strip().replace("sy ", "")
     except Exception:
         # Try cargo build version
         try:
@@ -181,8 +251,7 @@ def get_version_info() -> dict:
 
     # rsync version
     try:
-        result = subprocess.run(["rsync", "--version"], capture_output=True, text=True)
-        first_line = result.stdout.split("\n")[0]
+        first_line = tool_version_output("rsync").split("\n")[0]
         info["rsync"] = (
             first_line.split()[2] if len(first_line.split()) > 2 else "unknown"
         )
@@ -197,6 +266,35 @@ def get_version_info() -> dict:
 # ============================================================================
 
 
+def write_file(path: Path, data: bytes):
+    """Write data to path with raw os calls (no buffered file object)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def write_large_file(path: Path, fill: bytes, size: int):
+    """
+    Write size bytes of a repeated fill byte in fixed-size chunks, so the
+    file's contents are never materialized in memory at once.
+    """
+    block = memoryview(fill * min(size, WRITE_CHUNK_SIZE))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Reserve the extent up front (not available on macOS)
+        if size and hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, size)
+        remaining = size
+        while remaining:
+            remaining -= os.write(fd, block[:remaining])
+    finally:
+        os.close(fd)
+
+
 def generate_test_data(base_dir: Path, config: dict) -> tuple[int, int]:
     """
     Generate test files and directories.
@@ -228,41 +326,68 @@ def generate_test_data(base_dir: Path, config: dict) -> tuple[int, int]:
     if not directories:
         directories = [base_dir]
 
-    # Create regular files
-    content_block = b"x" * 1024  # 1KB block
-    for i in range(files_count):
-        dir_idx = i % len(directories)
-        file_path = directories[dir_idx] / f"file_{i}.txt"
-        content = content_block * size_kb
-        file_path.write_bytes(content)
-        total_bytes += len(content)
-        actual_files += 1
-
-    # Create large files if specified
-    large_content = b"L" * 1024 * large_size_kb
+    # Create regular files (content is identical for every file). Writes
+    # release the GIL, so a thread pool overlaps the per-file syscalls.
+    file_size = 1024 * size_kb
+    file_paths = [
+        directories[i % len(directories)] / f"file_{i}.txt" for i in range(files_count)
+    ]
+    if file_size > WRITE_CHUNK_SIZE:
+        for file_path in file_paths:
+            write_large_file(file_path, b"x", file_size)
+    else:
+        content = b"x" * file_size
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as pool:
+            list(pool.map(lambda path: write_file(path, content), file_paths))
+    total_bytes += file_size * len(file_paths)
+    actual_files += len(file_paths)
+
+    # Create large files if specified. Contents are identical, so write the
+    # first one and let the kernel copy it for the rest.
+    large_bytes = 1024 * large_size_kb
     for i in range(large_files):
         file_path = base_dir / f"large_{i}.bin"
-        file_path.write_bytes(large_content)
-        total_bytes += len(large_content)
+        if i == 0:
+            write_large_file(file_path, b"L", large_bytes)
+        else:
+            shutil.copyfile(base_dir / "large_0.bin", file_path)
+        total_bytes += large_bytes
         actual_files += 1
 
     return actual_files, total_bytes
 
 
+def iter_files(root, suffixes: tuple[str, ...]):
+    """
+    Recursively yield paths of regular files ending in one of suffixes.
+    Uses os.scandir so the cached DirEntry type avoids a stat() per entry.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path, suffixes)
+            elif entry.is_file(follow_symlinks=False) and entry.name.endswith(suffixes):
+                yield entry.path
+
+
 def modify_files(base_dir: Path, percent: float = 10) -> int:
     """
     Modify a percentage of files for incremental/delta testing.
     Returns count of modified files.
     """
-    all_files = list(base_dir.rglob("*.txt")) + list(base_dir.rglob("*.bin"))
+    # Regular files first, then large files (same order as before)
+    all_files = sorted(
+        iter_files(base_dir, (".txt", ".bin")), key=lambda p: p.endswith(".bin")
+    )
     modify_count = max(1, int(len(all_files) * percent / 100))
 
-    for i, file_path in enumerate(all_files[:modify_count]):
-        content = file_path.read_bytes()
-        # Modify middle of file (triggers delta sync)
-        mid = len(content) // 2
-        modified = content[:mid] + b"MODIFIED" + content[mid + 8 :]
-        file_path.write_bytes(modified)
+    for file_path in all_files[:modify_count]:
+        # Modify middle of file in place (triggers delta sync)
+        fd = os.open(file_path, os.O_RDWR)
+        try:
+            os.pwrite(fd, b"MODIFIED", os.fstat(fd).st_size // 2)
+        finally:
+            os.close(fd)
 
     return modify_count
 
@@ -272,6 +397,23 @@ def modify_files(base_dir: Path, percent: float = 10) -> int:
 # ============================================================================
 
 
+def run_command(args: list[str]) -> tuple[float, bool, str]:
+    """
+    Run a command and return (duration_ms, success, error_msg).
+    """
+    # stdout is discarded so progress output isn't piped through Python
+    start = time.perf_counter_ns()
+    result = subprocess.run(
+        args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    duration_ms = (time.perf_counter_ns() - start) / 1e6
+
+    if result.returncode != 0:
+        return duration_ms, False, result.stderr[:200]
+
+    return duration_ms, True, ""
+
+
 def run_sy(
     source: str, dest: str, extra_args: list[str] = None
 ) -> tuple[float, bool, str]:
@@ -281,15 +423,7 @@ def run_sy(
     args = ["sy", source, dest]
     if extra_args:
         args.extend(extra_args)
-
-    start = time.perf_counter()
-    result = subprocess.run(args, capture_output=True, text=True)
-    duration_ms = (time.perf_counter() - start) * 1000
-
-    if result.returncode != 0:
-        return duration_ms, False, result.stderr[:200]
-
-    return duration_ms, True, ""
+    return run_command(args)
 
 
 def run_rsync(
@@ -301,15 +435,202 @@ def run_rsync(
     args = ["rsync", "-a", f"{source}/", dest]
     if extra_args:
         args.extend(extra_args)
+    return run_command(args)
+
+
+def ssh_control_open(ssh_target: str) -> Optional[str]:
+    """
+    Start a background SSH master connection and return its control path.
+    Later ssh_run calls reuse it instead of paying a new handshake each time.
+    Returns None if the master could not be started.
+    """
+    control_dir = tempfile.mkdtemp(prefix="sy-bench-ssh-")
+    control_path = os.path.join(control_dir, "master")
+    try:
+        # Output must not be captured: older OpenSSH keeps stdio open in the
+        # daemonized master, so captured pipes would never reach EOF
+        result = subprocess.run(
+            [
+                "ssh",
+                "-f",
+                "-N",
+                "-M",
+                "-o",
+                f"ControlPath={control_path}",
+                "-o",
+                "ControlPersist=10m",
+                ssh_target,
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=60,
+        )
+        ok = result.returncode == 0
+    except subprocess.TimeoutExpired:
+        ok = False
+
+    if not ok:
+        shutil.rmtree(control_dir, ignore_errors=True)
+        return None
+    return control_path
+
+
+def ssh_control_close(ssh_target: str, control_path: Optional[str]):
+    """Shut down the SSH master connection and remove its socket directory."""
+    if control_path is None:
+        return
+    subprocess.run(
+        ["ssh", "-O", "exit", "-o", f"ControlPath={control_path}", ssh_target],
+        capture_output=True,
+    )
+    shutil.rmtree(os.path.dirname(control_path), ignore_errors=True)
+
+
+def ssh_run(ssh_target: str, control_path: Optional[str], command: str):
+    """Run a remote command, over the shared SSH master connection if open."""
+    options = []
+    if control_path is not None:
+        options = ["-o", f"ControlPath={control_path}", "-o", "ControlMaster=auto"]
+    subprocess.run(["ssh", *options, ssh_target, command], capture_output=True)
+
+
+def median(values: list[float]) -> float:
+    """Median of timing samples; a single sample is returned as-is."""
+    return values[0] if len(values) == 1 else statistics.median(values)
 
-    start = time.perf_counter()
-    result = subprocess.run(args, capture_output=True, text=True)
-    duration_ms = (time.perf_counter() - start) * 1000
 
+def delta_meaningful(config: dict) -> bool:
+    """
+    Whether the delta step can exercise block matching for a scenario.
+    modify_files rewrites the middle of each file, so a file needs at least
+    two rsync-sized blocks for any block to survive unchanged.
+    """
+    if config.get("large_files", 0):
+        return True
+    return config.get("size_kb", 1) * 1024 >= 2 * RSYNC_MIN_BLOCK_SIZE
+
+
+def drop_caches():
+    """
+    Flush dirty pages and drop the OS page cache (needs sudo).
+    Raises RuntimeError if the cache could not be dropped, so a cold-cache
+    run never silently measures a warm cache.
+    """
+    system = platform.system()
+    if system == "Linux":
+        cmd = ["sudo", "sh", "-c", "sync; echo 3 > /proc/sys/vm/drop_caches"]
+    elif system == "Darwin":
+        cmd = ["sudo", "purge"]
+    else:
+        raise RuntimeError(f"--cold-cache is not supported on {system}")
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError as e:
+        raise RuntimeError(f"dropping the page cache failed: {e}") from e
     if result.returncode != 0:
-        return duration_ms, False, result.stderr[:200]
+        raise RuntimeError(
+            f"dropping the page cache failed: {result.stderr.strip() or cmd}"
+        )
 
-    return duration_ms, True, ""
+
+def check_ramdisk():
+    """Raise RuntimeError if ramdisk() can't provide a RAM disk here."""
+    system = platform.system()
+    if system == "Linux":
+        if not os.path.isdir("/dev/shm"):
+            raise RuntimeError("--ramdisk needs /dev/shm, which does not exist")
+    elif system == "Darwin":
+        # diskutil would mount a second volume as "<name> 1" instead
+        if os.path.exists(f"/Volumes/{RAMDISK_VOLUME}"):
+            raise RuntimeError(
+                f"/Volumes/{RAMDISK_VOLUME} already exists; eject it first"
+            )
+    else:
+        raise RuntimeError(f"--ramdisk is not supported on {system}")
+
+
+@contextmanager
+def ramdisk(size_mb: int = 2048):
+    """
+    Yield a RAM-backed directory for test data: /dev/shm on Linux, a
+    temporary HFS+ RAM disk on macOS (detached on exit).
+    Raises RuntimeError where check_ramdisk() fails.
+    """
+    check_ramdisk()
+    if platform.system() == "Linux":
+        yield "/dev/shm"
+    else:
+        sectors = size_mb * 2048  # 512-byte sectors
+        device = subprocess.run(
+            ["hdiutil", "attach", "-nomount", f"ram://{sectors}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        try:
+            subprocess.run(
+                ["diskutil", "erasevolume", "HFS+", RAMDISK_VOLUME, device],
+                capture_output=True,
+                check=True,
+            )
+            yield f"/Volumes/{RAMDISK_VOLUME}"
+        finally:
+            subprocess.run(["hdiutil", "detach", device], capture_output=True)
+
+
+def bench_op(
+    run: Callable[[], tuple[float, bool, str]],
+    scenario: str,
+    tool: str,
+    operation: str,
+    iterations: int,
+    files_count: int,
+    bytes_total: int,
+    cleanup: Optional[Callable[[], None]] = None,
+    cold_cache: bool = False,
+) -> list[BenchmarkResult]:
+    """
+    Time `run` over several iterations and return its median result.
+    cleanup() runs before each iteration. A failure on the first
+    iteration is returned as an error result and stops the operation.
+    """
+    durations = []
+    for i in range(iterations):
+        if cleanup:
+            cleanup()
+        if cold_cache:
+            drop_caches()
+
+        duration, success, error = run()
+        if success:
+            durations.append(duration)
+        elif i == 0:  # Only record error on first try
+            return [
+                BenchmarkResult(
+                    scenario=scenario,
+                    tool=tool,
+                    operation=operation,
+                    duration_ms=duration,
+                    files_count=files_count,
+                    bytes_total=bytes_total,
+                    error=error,
+                )
+            ]
+
+    if not durations:
+        return []
+
+    return [
+        BenchmarkResult(
+            scenario=scenario,
+            tool=tool,
+            operation=operation,
+            duration_ms=median(durations),
+            files_count=files_count,
+            bytes_total=bytes_total,
+        )
+    ]
 
 
 def benchmark_scenario(
@@ -318,13 +639,18 @@ def benchmark_scenario(
     transport: str = "local",
     ssh_target: str = None,
     iterations: int = 3,
+    cold_cache: bool = False,
+    tmp_root: Optional[str] = None,
 ) -> list[BenchmarkResult]:
     """
     Run a complete benchmark scenario (initial + incremental + delta).
+    With cold_cache, the OS page cache is dropped before every timed run.
+    Test data lives in a temporary directory under tmp_root if given.
     """
     results = []
 
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with ExitStack() as stack:
+        tmpdir = stack.enter_context(tempfile.TemporaryDirectory(dir=tmp_root))
         source_dir = Path(tmpdir) / "source"
         source_dir.mkdir()
 
@@ -333,205 +659,110 @@ def benchmark_scenario(
         print(f"  Generated {files_count} files ({bytes_total / 1_000_000:.1f} MB)")
 
         # Determine source/dest paths based on transport
+        source_path = str(source_dir)
         if transport == "ssh" and ssh_target:
             # For SSH: sync to remote
             remote_base = f"/tmp/sy_bench_{os.getpid()}"
-            source_path = str(source_dir)
             sy_dest = f"{ssh_target}:{remote_base}/sy"
             rsync_dest = f"{ssh_target}:{remote_base}/rsync"
 
+            # One master connection carries all cleanup commands; it is
+            # closed (after removing the remote dirs) even if a run raises
+            control_path = ssh_control_open(ssh_target)
+            stack.callback(ssh_control_close, ssh_target, control_path)
+
             # Clean remote dirs
-            subprocess.run(
-                ["ssh", ssh_target, f"rm -rf {remote_base}"], capture_output=True
-            )
-            subprocess.run(
-                ["ssh", ssh_target, f"mkdir -p {remote_base}"], capture_output=True
+            ssh_run(
+                ssh_target,
+                control_path,
+                f"rm -rf {remote_base}; mkdir -p {remote_base}",
             )
+            stack.callback(ssh_run, ssh_target, control_path, f"rm -rf {remote_base}")
+
+            def clear_sy():
+                ssh_run(ssh_target, control_path, f"rm -rf {remote_base}/sy")
+
+            def clear_rsync():
+                ssh_run(ssh_target, control_path, f"rm -rf {remote_base}/rsync")
+
         else:
-            source_path = str(source_dir)
             sy_dest = str(Path(tmpdir) / "dest_sy")
             rsync_dest = str(Path(tmpdir) / "dest_rsync")
 
-        # =========== INITIAL SYNC ===========
-        print("  Testing initial sync...")
-
-        # sy initial
-        durations = []
-        for i in range(iterations):
-            if transport != "ssh":
-                # Clear dest for each iteration
+            def clear_sy():
                 shutil.rmtree(sy_dest, ignore_errors=True)
-            else:
-                subprocess.run(
-                    ["ssh", ssh_target, f"rm -rf {remote_base}/sy"], capture_output=True
-                )
-
-            duration, success, error = run_sy(source_path, sy_dest)
-            if success:
-                durations.append(duration)
-            elif i == 0:  # Only record error on first try
-                results.append(
-                    BenchmarkResult(
-                        scenario=scenario_name,
-                        tool="sy",
-                        operation="initial",
-                        duration_ms=duration,
-                        files_count=files_count,
-                        bytes_total=bytes_total,
-                        error=error,
-                    )
-                )
-                break
 
-        if durations:
-            median_duration = sorted(durations)[len(durations) // 2]
-            results.append(
-                BenchmarkResult(
-                    scenario=scenario_name,
-                    tool="sy",
-                    operation="initial",
-                    duration_ms=median_duration,
-                    files_count=files_count,
-                    bytes_total=bytes_total,
-                )
-            )
-
-        # rsync initial
-        durations = []
-        for i in range(iterations):
-            if transport != "ssh":
+            def clear_rsync():
                 shutil.rmtree(rsync_dest, ignore_errors=True)
-            else:
-                subprocess.run(
-                    ["ssh", ssh_target, f"rm -rf {remote_base}/rsync"],
-                    capture_output=True,
-                )
-
-            duration, success, error = run_rsync(source_path, rsync_dest)
-            if success:
-                durations.append(duration)
-            elif i == 0:
-                results.append(
-                    BenchmarkResult(
-                        scenario=scenario_name,
-                        tool="rsync",
-                        operation="initial",
-                        duration_ms=duration,
-                        files_count=files_count,
-                        bytes_total=bytes_total,
-                        error=error,
-                    )
-                )
-                break
 
-        if durations:
-            median_duration = sorted(durations)[len(durations) // 2]
-            results.append(
-                BenchmarkResult(
-                    scenario=scenario_name,
-                    tool="rsync",
-                    operation="initial",
-                    duration_ms=median_duration,
-                    files_count=files_count,
-                    bytes_total=bytes_total,
+        def sync_sy():
+            return run_sy(source_path, sy_dest)
+
+        def sync_rsync():
+            return run_rsync(source_path, rsync_dest)
+
+        def bench(tool, run, operation, files, nbytes, cleanup=None):
+            results.extend(
+                bench_op(
+                    run,
+                    scenario_name,
+                    tool,
+                    operation,
+                    iterations,
+                    files,
+                    nbytes,
+                    cleanup=cleanup,
+                    cold_cache=cold_cache,
                 )
             )
 
+        # =========== INITIAL SYNC ===========
+        print("  Testing initial sync...")
+        # Clear dest before each iteration
+        bench("sy", sync_sy, "initial", files_count, bytes_total, clear_sy)
+        bench("rsync", sync_rsync, "initial", files_count, bytes_total, clear_rsync)
+
         # =========== INCREMENTAL SYNC (no changes) ===========
         print("  Testing incremental sync (no changes)...")
-
-        # sy incremental
-        durations = []
-        for _ in range(iterations):
-            duration, success, _ = run_sy(source_path, sy_dest)
-            if success:
-                durations.append(duration)
-
-        if durations:
-            median_duration = sorted(durations)[len(durations) // 2]
-            results.append(
-                BenchmarkResult(
-                    scenario=scenario_name,
-                    tool="sy",
-                    operation="incremental",
-                    duration_ms=median_duration,
-                    files_count=files_count,
-                    bytes_total=0,  # No bytes transferred
-                )
-            )
-
-        # rsync incremental
-        durations = []
-        for _ in range(iterations):
-            duration, success, _ = run_rsync(source_path, rsync_dest)
-            if success:
-                durations.append(duration)
-
-        if durations:
-            median_duration = sorted(durations)[len(durations) // 2]
-            results.append(
-                BenchmarkResult(
-                    scenario=scenario_name,
-                    tool="rsync",
-                    operation="incremental",
-                    duration_ms=median_duration,
-                    files_count=files_count,
-                    bytes_total=0,
-                )
-            )
+        # No bytes transferred
+        bench("sy", sync_sy, "incremental", files_count, 0)
+        bench("rsync", sync_rsync, "incremental", files_count, 0)
 
         # =========== DELTA SYNC (10% modified) ===========
-        print("  Testing delta sync (10% modified)...")
-
-        modified_count = modify_files(source_dir, percent=10)
-        modified_bytes = modified_count * config.get("size_kb", 1) * 1024
+        if not delta_meaningful(config):
+            print("  Skipping delta sync (files too small for block matching)")
+        else:
+            print("  Testing delta sync (10% modified)...")
 
-        # sy delta
-        durations = []
-        for _ in range(iterations):
-            duration, success, _ = run_sy(source_path, sy_dest)
-            if success:
-                durations.append(duration)
+            modified_count = modify_files(source_dir, percent=10)
+            modified_bytes = modified_count * config.get("size_kb", 1) * 1024
 
-        if durations:
-            median_duration = sorted(durations)[len(durations) // 2]
-            results.append(
-                BenchmarkResult(
-                    scenario=scenario_name,
-                    tool="sy",
-                    operation="delta",
-                    duration_ms=median_duration,
-                    files_count=modified_count,
-                    bytes_total=modified_bytes,
-                )
-            )
+            bench("sy", sync_sy, "delta", modified_count, modified_bytes)
+            bench("rsync", sync_rsync, "delta", modified_count, modified_bytes)
 
-        # rsync delta
-        durations = []
-        for _ in range(iterations):
-            duration, success, _ = run_rsync(source_path, rsync_dest)
-            if success:
-                durations.append(duration)
+    return results
 
-        if durations:
-            median_duration = sorted(durations)[len(durations) // 2]
-            results.append(
-                BenchmarkResult(
-                    scenario=scenario_name,
-                    tool="rsync",
-                    operation="delta",
-                    duration_ms=median_duration,
-                    files_count=modified_count,
-                    bytes_total=modified_bytes,
-                )
-            )
 
-        # Cleanup SSH remote
-        if transport == "ssh" and ssh_target:
-            subprocess.run(
-                ["ssh", ssh_target, f"rm -rf {remote_base}"], capture_output=True
+def benchmark_startup(iterations: int = 3) -> list[BenchmarkResult]:
+    """
+    Time `<tool> --version` to measure process startup overhead, which is
+    included in every sync timing (dominant for incremental runs).
+    """
+    results = []
+    for tool in ["sy", "rsync"]:
+        if shutil.which(tool) is None:
+            continue
+        results.extend(
+            bench_op(
+                lambda tool=tool: run_command([tool, "--version"]),
+                "process",
+                tool,
+                "startup",
+                iterations,
+                0,
+                0,
             )
-
+        )
     return results
 
 
@@ -539,6 +770,25 @@ def benchmark_scenario(
 # History & Reporting
 # ============================================================================
 
+# Report tables are built in a buffer and written once; the constant
+# header lines and row templates are prepared here rather than on every call
+RULE = "=" * 80
+
+HISTORY_HEADER = (
+    f"{'Scenario':<15} {'Operation':<12} {'sy (ms)':<12} {'rsync (ms)':<12} {'Speedup':<10}\n"
+    + "-" * 65
+    + "\n"
+)
+HISTORY_ROW = "{:<15} {:<12} {:<12.1f} {:<12.1f} {:<10}\n"
+
+RESULTS_HEADER = (
+    f"{'Scenario':<15} {'Operation':<12} {'Tool':<8} {'Time (ms)':<12} {'MB/s':<10} {'Files/s':<10}\n"
+    + "-" * 75
+    + "\n"
+)
+RESULTS_ROW = "{:<15} {:<12} {:<8} {:<12.1f} {:<10.1f} {:<10.1f}\n"
+RESULTS_ERROR_ROW = "{:<15} {:<12} {:<8} ERROR: {}\n"
+
 
 def save_run(run: BenchmarkRun):
     """Save benchmark run to JSONL history file."""
@@ -568,8 +818,9 @@ def save_run(run: BenchmarkRun):
     if run.notes:
         run_dict["notes"] = run.notes
 
-    with open(HISTORY_FILE, "a") as f:
-        f.write(json.dumps(run_dict) + "\n")
+    # One run per line; a single buffered flush appends it
+    with open(HISTORY_FILE, "ab", buffering=1 << 20) as f:
+        f.writelines((dump_json(run_dict), b"\n"))
 
     print(f"\nResults saved to {HISTORY_FILE}")
 
@@ -579,13 +830,14 @@ def load_history(limit: int = 10) -> list[dict]:
     if not HISTORY_FILE.exists():
         return []
 
-    runs = []
-    with open(HISTORY_FILE) as f:
+    # Only the last `limit` lines are kept and parsed
+    lines = deque(maxlen=limit)
+    with open(HISTORY_FILE, "rb") as f:
         for line in f:
             if line.strip():
-                runs.append(json.loads(line))
+                lines.append(line)
 
-    return runs[-limit:]
+    return [load_json(line) for line in lines]
 
 
 def show_history(limit: int = 10):
@@ -596,33 +848,28 @@ def show_history(limit: int = 10):
         print("No benchmark history found.")
         return
 
-    print(f"\n{'=' * 80}")
-    print("Recent Benchmark History")
-    print(f"{'=' * 80}\n")
+    buf = io.StringIO()
+    buf.write(f"\n{RULE}\nRecent Benchmark History\n{RULE}\n\n")
 
     for run in runs:
-        print(
-            f"Date: {run['ts'][:19]} | Commit: {run['git']['commit']} | Transport: {run['transport']}"
-        )
-        print(
-            f"System: {run['sys'].get('cpu', 'unknown')[:30]} ({run['sys']['cores']} cores)"
+        buf.write(
+            f"Date: {run['ts'][:19]} | Commit: {run['git']['commit']} | Transport: {run['transport']}\n"
         )
-        print()
-
-        # Group by scenario
-        by_scenario = {}
-        for r in run["results"]:
-            key = (r["scenario"], r["op"])
-            if key not in by_scenario:
-                by_scenario[key] = {}
-            by_scenario[key][r["tool"]] = r
-
-        print(
-            f"{'Scenario':<15} {'Operation':<12} {'sy (ms)':<12} {'rsync (ms)':<12} {'Speedup':<10}"
+        buf.write(
+            f"System: {run['sys'].get('cpu', 'unknown')[:30]} ({run['sys']['cores']} cores)\n"
         )
-        print("-" * 65)
+        buf.write("\n")
+
+        buf.write(HISTORY_HEADER)
 
-        for (scenario, op), tools in sorted(by_scenario.items()):
+        # Sort once and walk (scenario, op) groups in order
+        results_sorted = sorted(
+            run["results"], key=itemgetter("scenario", "op", "tool")
+        )
+        for (scenario, op), group in groupby(
+            results_sorted, key=itemgetter("scenario", "op")
+        ):
+            tools = {r["tool"]: r for r in group}
             sy_ms = tools.get("sy", {}).get("ms", 0)
             rsync_ms = tools.get("rsync", {}).get("ms", 0)
 
@@ -634,11 +881,11 @@ def show_history(limit: int = 10):
             else:
                 speedup_str = "N/A"
 
-            print(
-                f"{scenario:<15} {op:<12} {sy_ms:<12.1f} {rsync_ms:<12.1f} {speedup_str:<10}"
-            )
+            buf.write(HISTORY_ROW.format(scenario, op, sy_ms, rsync_ms, speedup_str))
 
-        print()
+        buf.write("\n")
+
+    sys.stdout.write(buf.getvalue())
 
 
 def compare_runs(run1: dict, run2: dict):
@@ -681,9 +928,8 @@ def compare_runs(run1: dict, run2: dict):
 
 def print_results(results: list[BenchmarkResult]):
     """Print benchmark results table."""
-    print(f"\n{'=' * 80}")
-    print("Benchmark Results")
-    print(f"{'=' * 80}\n")
+    buf = io.StringIO()
+    buf.write(f"\n{RULE}\nBenchmark Results\n{RULE}\n\n")
 
     # Group by scenario and operation
     by_scenario = {}
@@ -693,28 +939,30 @@ def print_results(results: list[BenchmarkResult]):
             by_scenario[key] = {}
         by_scenario[key][r.tool] = r
 
-    print(
-        f"{'Scenario':<15} {'Operation':<12} {'Tool':<8} {'Time (ms)':<12} {'MB/s':<10} {'Files/s':<10}"
-    )
-    print("-" * 75)
+    buf.write(RESULTS_HEADER)
 
     for (scenario, op), tools in sorted(by_scenario.items()):
         for tool_name in ["sy", "rsync"]:
             if tool_name in tools:
                 r = tools[tool_name]
                 if r.error:
-                    print(
-                        f"{scenario:<15} {op:<12} {tool_name:<8} ERROR: {r.error[:30]}"
+                    buf.write(
+                        RESULTS_ERROR_ROW.format(scenario, op, tool_name, r.error[:30])
                     )
                 else:
-                    print(
-                        f"{scenario:<15} {op:<12} {tool_name:<8} {r.duration_ms:<12.1f} {r.throughput_mbps:<10.1f} {r.files_per_sec:<10.1f}"
+                    buf.write(
+                        RESULTS_ROW.format(
+                            scenario,
+                            op,
+                            tool_name,
+                            r.duration_ms,
+                            r.throughput_mbps,
+                            r.files_per_sec,
+                        )
                     )
 
     # Summary comparison
-    print(f"\n{'=' * 80}")
-    print("Summary: sy vs rsync")
-    print(f"{'=' * 80}\n")
+    buf.write(f"\n{RULE}\nSummary: sy vs rsync\n{RULE}\n\n")
 
     for (scenario, op), tools in sorted(by_scenario.items()):
         sy_r = tools.get("sy")
@@ -724,9 +972,11 @@ def print_results(results: list[BenchmarkResult]):
             if sy_r.duration_ms > 0:
                 speedup = rsync_r.duration_ms / sy_r.duration_ms
                 if speedup >= 1:
-                    print(f"{scenario}/{op}: sy is {speedup:.2f}x FASTER")
+                    buf.write(f"{scenario}/{op}: sy is {speedup:.2f}x FASTER\n")
                 else:
-                    print(f"{scenario}/{op}: sy is {1 / speedup:.2f}x SLOWER")
+                    buf.write(f"{scenario}/{op}: sy is {1 / speedup:.2f}x SLOWER\n")
+
+    sys.stdout.write(buf.getvalue())
 
 
 # ============================================================================
@@ -734,8 +984,36 @@ def print_results(results: list[BenchmarkResult]):
 # ============================================================================
 
 
+def parse_cpu_list(spec: str) -> set[int]:
+    """
+    Parse a CPU list like "0-3,6" into a set of CPU ids (argparse type).
+    Raises argparse.ArgumentTypeError on malformed input.
+    """
+    cpus = set()
+    try:
+        for part in spec.split(","):
+            if "-" in part:
+                lo, hi = part.split("-")
+                if int(lo) > int(hi):
+                    raise ValueError(part)
+                cpus.update(range(int(lo), int(hi) + 1))
+            else:
+                cpus.add(int(part))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid CPU list {spec!r} (expected e.g. 0-3 or 0,2)"
+        ) from None
+    if not cpus or min(cpus) < 0:
+        raise argparse.ArgumentTypeError(f"invalid CPU list {spec!r}")
+    return cpus
+
+
 def main():
-    parser = argparse.ArgumentParser(description="sy vs rsync benchmark runner")
+    parser = argparse.ArgumentParser(
+        description="sy vs rsync benchmark runner",
+        epilog="The delta step is skipped for scenarios whose files are too small "
+        f"for block matching (under {2 * RSYNC_MIN_BLOCK_SIZE} bytes).",
+    )
     parser.add_argument("--quick", action="store_true", help="Run quick smoke test")
     parser.add_argument(
         "--ssh", type=str, help="SSH target (user@host) for remote testing"
@@ -745,6 +1023,26 @@ def main():
     parser.add_argument("--compare", action="store_true", help="Compare last 2 runs")
     parser.add_argument("--notes", type=str, default="", help="Notes for this run")
     parser.add_argument("--scenario", type=str, help="Run specific scenario only")
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="Also measure process startup overhead (sy/rsync --version)",
+    )
+    parser.add_argument(
+        "--ramdisk",
+        action="store_true",
+        help="Keep test data on a RAM disk to measure CPU/syscall cost, not disk I/O",
+    )
+    parser.add_argument(
+        "--cold-cache",
+        action="store_true",
+        help="Drop the OS page cache before each timed run (needs sudo)",
+    )
+    parser.add_argument(
+        "--cpus",
+        type=parse_cpu_list,
+        help="Pin the benchmark and tools to these CPUs, e.g. 0-3 or 0,2 (Linux)",
+    )
     args = parser.parse_args()
 
     # History commands
@@ -792,10 +1090,43 @@ def main():
     print(f"Iterations: {args.iterations}")
     if args.ssh:
         print(f"SSH Target: {args.ssh}")
+    if args.cold_cache:
+        # Fail before any data is generated if sudo is denied
+        try:
+            drop_caches()
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print("Page cache: dropped before each run")
+    if args.cpus:
+        if not hasattr(os, "sched_setaffinity"):
+            print("Error: --cpus is only supported on Linux")
+            sys.exit(1)
+        cpu_list = ",".join(map(str, sorted(args.cpus)))
+        # Children inherit the affinity mask, so pinning once covers sy/rsync
+        try:
+            os.sched_setaffinity(0, args.cpus)
+        except OSError as e:
+            print(f"Error: cannot pin to CPUs {cpu_list}: {e}")
+            sys.exit(1)
+        print(f"CPUs: {cpu_list}")
+    if args.ramdisk:
+        try:
+            check_ramdisk()
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
     print()
 
     # Collect system info
     system_info = get_system_info()
+    # Record run conditions so history/compare don't mix unlike runs
+    if args.ramdisk:
+        system_info["ramdisk"] = True
+    if args.cold_cache:
+        system_info["cold_cache"] = True
+    if args.cpus:
+        system_info["cpus"] = cpu_list
     git_info = get_git_info()
     version_info = get_version_info()
 
@@ -809,16 +1140,27 @@ def main():
     # Run benchmarks
     all_results = []
 
-    for scenario_name, config in scenarios.items():
-        print(f"\n--- Scenario: {scenario_name} ---")
-        results = benchmark_scenario(
-            scenario_name,
-            config,
-            transport=transport,
-            ssh_target=args.ssh,
-            iterations=args.iterations,
-        )
-        all_results.extend(results)
+    if args.startup:
+        print("\n--- Process startup ---")
+        all_results.extend(benchmark_startup(args.iterations))
+
+    with ExitStack() as stack:
+        tmp_root = stack.enter_context(ramdisk()) if args.ramdisk else None
+        if tmp_root:
+            print(f"\nTest data on RAM disk: {tmp_root}")
+
+        for scenario_name, config in scenarios.items():
+            print(f"\n--- Scenario: {scenario_name} ---")
+            results = benchmark_scenario(
+                scenario_name,
+                config,
+                transport=transport,
+                ssh_target=args.ssh,
+                iterations=args.iterations,
+                cold_cache=args.cold_cache,
+                tmp_root=tmp_root,
+            )
+            all_results.extend(results)
 
     # Print results
     print_results(all_results)
@@ -20,15 +20,26 @@ Usage:
     uv run scripts/test-cross-platform.py --skip-build # Skip cargo builds
     uv run scripts/test-cross-platform.py --local-only # Skip SSH tests
     uv run scripts/test-cross-platform.py --perf       # Run performance baselines
+    uv run scripts/test-cross-platform.py --jobs 4     # Run independent tests concurrently
 """
 
 import argparse
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 # Optional rich import for nicer output
 try:
@@ -51,6 +62,22 @@ FEDORA_REPO = "~/github/nijaru/sy"
 PROJECT_ROOT = Path(__file__).parent.parent
 SY_BIN = PROJECT_ROOT / "target/release/sy"
 
+# Lines of failing output kept for the error report
+ERROR_TAIL_LINES = 10
+
+# Commit the release binaries were last built from (same path on Fedora)
+BUILD_STAMP = "target/.sy-build-stamp"
+# Inputs whose uncommitted changes (or newer mtimes) invalidate a build
+BUILD_INPUTS = ["src", "Cargo.toml", "Cargo.lock"]
+
+# Contents of the binary fixture file: every byte value once
+BINARY_FIXTURE = bytes(range(256))
+
+# libtest threads: every core for suites on the serial critical path, half
+# for a suite that overlaps other test groups (--jobs > 1)
+TEST_THREADS = os.cpu_count() or 1
+SHARED_TEST_THREADS = max(1, TEST_THREADS // 2)
+
 
 # ============================================================================
 # Output helpers
@@ -98,45 +125,108 @@ else:
 class TestResult:
     name: str
     passed: bool
-    duration: float
+    duration_ns: int
     error: Optional[str] = None
 
+    @property
+    def duration(self) -> float:
+        return self.duration_ns / 1e9
+
 
 class TestRunner:
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, jobs: int = 1):
         self.verbose = verbose
+        self.jobs = jobs
+        # Wall-clock start: with --jobs > 1, test durations overlap
+        self.started_ns = time.perf_counter_ns()
         self.results: list[TestResult] = []
+        self._lock = threading.Lock()
+        # Caps subprocesses in flight across all (possibly nested) worker pools
+        self._slots = threading.BoundedSemaphore(max(1, jobs))
+        # SSH multiplexing: remote commands share one master connection
+        self.ssh_control: Optional[str] = None
+
+        # One live display for every running test, whichever thread runs it
+        self.progress = None
+        if RICH_AVAILABLE and not verbose:
+            self.progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[bold blue]{task.description}..."),
+                TimeElapsedColumn(),
+                console=console,
+                transient=True,
+            )
+            self.progress.start()
+            atexit.register(self.progress.stop)
+        # Fixed for the runner's lifetime, so pick it once
+        self._execute = self._execute_plain if self.progress is None else self._execute_with_progress
 
     def run(self, name: str, cmd: list[str], cwd: Optional[Path] = None,
-            timeout: int = 300) -> bool:
+            timeout: int = 300, env: Optional[dict[str, str]] = None) -> bool:
         """Run a test command and track result."""
-        start = time.time()
-
-        def do_run():
-            return subprocess.run(
-                cmd,
-                cwd=cwd or PROJECT_ROOT,
-                capture_output=not self.verbose,
-                text=True,
-                timeout=timeout,
-            )
+        with self._slots:
+            return self._run(name, cmd, cwd, timeout, env)
+
+    def _execute_plain(self, name: str, cmd: list[str], cwd: Optional[Path],
+                       timeout: int, env: Optional[dict[str, str]]) -> tuple[int, Optional[str]]:
+        """Run cmd to completion; returns its exit code and output tail."""
+        # Own session so a timeout can take down the whole process tree
+        # (cargo test children would otherwise keep the target/ lock)
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd or PROJECT_ROOT,
+            stdin=subprocess.DEVNULL,
+            # Stream output through a bounded ring instead of buffering the
+            # whole log; cargo test reports failures on stdout, so merge it
+            stdout=None if self.verbose else subprocess.PIPE,
+            stderr=None if self.verbose else subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            env=env,
+            start_new_session=True,
+        )
+        tail: deque[str] = deque(maxlen=ERROR_TAIL_LINES)
+        reader = None
+        if proc.stdout:
+            reader = threading.Thread(target=tail.extend, args=(proc.stdout,), daemon=True)
+            reader.start()
+        try:
+            proc.wait(timeout=timeout)
+        except BaseException:
+            # Timeout or Ctrl-C, which the new session no longer forwards
+            kill_process_group(proc)
+            raise
+        finally:
+            if reader:
+                reader.join()
+                proc.stdout.close()
+        return proc.returncode, None if self.verbose else "".join(tail)
+
+    def _execute_with_progress(self, name: str, cmd: list[str], cwd: Optional[Path],
+                               timeout: int, env: Optional[dict[str, str]]) -> tuple[int, Optional[str]]:
+        """Like _execute_plain, showing a spinner row while cmd runs."""
+        task_id = self.progress.add_task(name, total=None)
+        try:
+            return self._execute_plain(name, cmd, cwd, timeout, env)
+        finally:
+            self.progress.remove_task(task_id)
+
+    def _run(self, name: str, cmd: list[str], cwd: Optional[Path],
+             timeout: int, env: Optional[dict[str, str]]) -> bool:
+        start = time.perf_counter_ns()
 
         try:
-            if self.verbose or not RICH_AVAILABLE:
-                result = do_run()
-            else:
-                # Show spinner while running
-                with console.status(f"[bold blue]{name}...", spinner="dots"):
-                    result = do_run()
+            returncode, output = self._execute(name, cmd, cwd, timeout, env)
 
-            duration = time.time() - start
-            passed = result.returncode == 0
+            duration_ns = time.perf_counter_ns() - start
+            duration = duration_ns / 1e9
+            passed = returncode == 0
 
             error = None
             if not passed and not self.verbose:
-                error = result.stderr or result.stdout
+                error = output
 
-            self.results.append(TestResult(name, passed, duration, error))
+            self.record(TestResult(name, passed, duration_ns, error))
 
             if passed:
                 log_success(f"{name} ({duration:.1f}s)")
@@ -144,51 +234,106 @@ class TestRunner:
                 log_error(f"{name} ({duration:.1f}s)")
                 if error and not self.verbose:
                     # Show last few lines of error
-                    lines = error.strip().split('\n')[-10:]
+                    lines = error.strip().split('\n')[-ERROR_TAIL_LINES:]
                     for line in lines:
                         print(f"    {line}")
 
             return passed
         except subprocess.TimeoutExpired:
-            duration = time.time() - start
-            self.results.append(TestResult(name, False, duration, "Timeout"))
+            self.record(TestResult(name, False, time.perf_counter_ns() - start, "Timeout"))
             log_error(f"{name} (timeout after {timeout}s)")
             return False
         except Exception as e:
-            duration = time.time() - start
-            self.results.append(TestResult(name, False, duration, str(e)))
+            self.record(TestResult(name, False, time.perf_counter_ns() - start, str(e)))
             log_error(f"{name}: {e}")
             return False
 
+    def record(self, result: TestResult):
+        """Track a result (safe to call from worker threads)."""
+        with self._lock:
+            self.results.append(result)
+
+    def ssh_options(self) -> list[str]:
+        """ssh options that reuse the shared master connection, if opened."""
+        if not self.ssh_control:
+            return []
+        return ["-o", "ControlMaster=auto", "-o", f"ControlPath={self.ssh_control}"]
+
+    def open_ssh_master(self) -> bool:
+        """Start a background master connection that later ssh calls reuse.
+
+        Returns False if Fedora is unreachable.
+        """
+        ssh_dir = tempfile.mkdtemp(prefix="sy-ssh-")
+        self.ssh_control = f"{ssh_dir}/cm-%r@%h:%p"
+        atexit.register(self.close_ssh_master, ssh_dir)
+
+        try:
+            # Output must not be captured: the daemonized master would hold
+            # the pipes open and the call would never return. With -f, ssh
+            # only exits 0 once the connection is authenticated.
+            ok = subprocess.run(
+                ["ssh", "-fN", "-o", "ControlMaster=yes", "-o", f"ControlPath={self.ssh_control}",
+                 "-o", "ControlPersist=10m", "-o", "ConnectTimeout=5", "-o", "BatchMode=yes",
+                 f"{FEDORA_USER}@{FEDORA_HOST}"],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=30,
+            ).returncode == 0
+        except subprocess.TimeoutExpired:
+            ok = False
+
+        if not ok:
+            self.ssh_control = None
+        return ok
+
+    def close_ssh_master(self, ssh_dir: str):
+        """Stop the master connection and remove its socket directory."""
+        if self.ssh_control:
+            subprocess.run(
+                ["ssh", "-O", "exit", "-o", f"ControlPath={self.ssh_control}",
+                 f"{FEDORA_USER}@{FEDORA_HOST}"],
+                capture_output=True,
+            )
+        shutil.rmtree(ssh_dir, ignore_errors=True)
+
     def run_ssh(self, name: str, remote_cmd: str, timeout: int = 300) -> bool:
         """Run a command on Fedora via SSH."""
-        cmd = ["ssh", f"{FEDORA_USER}@{FEDORA_HOST}", remote_cmd]
+        cmd = ["ssh", *self.ssh_options(), f"{FEDORA_USER}@{FEDORA_HOST}", remote_cmd]
         return self.run(name, cmd, timeout=timeout)
 
     def summary(self) -> bool:
         """Print summary and return True if all passed."""
-        passed = sum(1 for r in self.results if r.passed)
-        failed = sum(1 for r in self.results if not r.passed)
-        total_time = sum(r.duration for r in self.results)
+        if self.progress is not None:
+            self.progress.stop()
 
         log_header("Test Summary")
 
+        table = None
         if RICH_AVAILABLE:
             table = Table()
             table.add_column("Test", style="cyan")
             table.add_column("Status")
             table.add_column("Duration", justify="right")
 
-            for r in self.results:
+        # Count and render in a single walk over the results
+        passed = failed = 0
+        for r in self.results:
+            if r.passed:
+                passed += 1
+            else:
+                failed += 1
+
+            if table is not None:
                 status = "[green]PASS[/green]" if r.passed else "[red]FAIL[/red]"
                 table.add_row(r.name, status, f"{r.duration:.1f}s")
-
-            console.print(table)
-        else:
-            for r in self.results:
+            else:
                 status = "PASS" if r.passed else "FAIL"
                 print(f"  {status}: {r.name} ({r.duration:.1f}s)")
 
+        if table is not None:
+            console.print(table)
+        total_time = (time.perf_counter_ns() - self.started_ns) / 1e9
+
         print()
         if failed == 0:
             log_success(f"All {passed} tests passed in {total_time:.1f}s")
@@ -198,6 +343,85 @@ class TestRunner:
         return failed == 0
 
 
+def kill_process_group(proc: subprocess.Popen):
+    """SIGTERM a session-leader child's process group, then SIGKILL stragglers."""
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    proc.wait()
+
+
+def run_parallel(jobs: int, tasks: list[Callable[[], bool]]) -> list[bool]:
+    """Run independent test callables on up to `jobs` threads."""
+    if jobs <= 1 or len(tasks) <= 1:
+        return [task() for task in tasks]
+    with ThreadPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        return list(pool.map(lambda task: task(), tasks))
+
+
+def file_digest(path: Path) -> Optional[bytes]:
+    """BLAKE2b digest of a file's contents, or None if it can't be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "blake2b").digest()
+    except OSError:
+        return None
+
+
+def prefetch(paths: list[Path]):
+    """Start kernel readahead on files about to be read (no-op without fadvise)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def build_cross_fs_fixture(root: Path):
+    """Files with various attributes for the cross-filesystem roundtrip."""
+    (root / "regular.txt").write_text("hello world")
+    (root / "empty.txt").write_text("")
+    (root / "subdir").mkdir()
+    (root / "subdir" / "nested.txt").write_text("nested content")
+
+    # Binary file
+    (root / "binary.bin").write_bytes(BINARY_FIXTURE)
+
+    # File with spaces and special chars
+    (root / "file with spaces.txt").write_text("spaces")
+    (root / "special!@#.txt").write_text("special")
+
+
+def build_cli_fixture(root: Path):
+    """Two small files for the CLI flag combinations."""
+    (root / "file1.txt").write_text("content1")
+    (root / "file2.txt").write_text("content2")
+
+
+def build_git_fixture(root: Path):
+    """A git repository with an ignored log file."""
+    subprocess.run(["git", "init"], cwd=root, capture_output=True)
+    (root / "README.md").write_text("# Test")
+    (root / ".gitignore").write_text("*.log\n")
+    (root / "debug.log").write_text("should be ignored with --gitignore")
+
+
 # ============================================================================
 # Test categories
 # ============================================================================
@@ -205,32 +429,94 @@ class TestRunner:
 def check_ssh_connection(runner: TestRunner) -> bool:
     """Verify SSH connection to Fedora."""
     log_info("Checking SSH connection...")
-    return runner.run(
-        "SSH connection",
-        ["ssh", "-o", "ConnectTimeout=5", "-o", "BatchMode=yes",
-         f"{FEDORA_USER}@{FEDORA_HOST}", "echo ok"],
-        timeout=10
-    )
+
+    # Opening the shared master is itself the connectivity check
+    start = time.perf_counter_ns()
+    ok = runner.open_ssh_master()
+    duration_ns = time.perf_counter_ns() - start
+    runner.record(TestResult("SSH connection", ok, duration_ns,
+                             None if ok else "Could not connect"))
+
+    if ok:
+        log_success(f"SSH connection ({duration_ns / 1e9:.1f}s)")
+    else:
+        log_error(f"SSH connection ({duration_ns / 1e9:.1f}s)")
+    return ok
+
+
+def cargo_env() -> Optional[dict[str, str]]:
+    """Environment routing rustc through sccache, if it's installed."""
+    if not shutil.which("sccache"):
+        return None
+    return {**os.environ, "RUSTC_WRAPPER": "sccache", "CARGO_INCREMENTAL": "0"}
+
+
+def binaries_fresh(binaries: list[Path]) -> bool:
+    """True if every binary is newer than all the build inputs."""
+    try:
+        built = min(b.stat().st_mtime_ns for b in binaries)
+    except FileNotFoundError:
+        return False
+
+    for entry in BUILD_INPUTS:
+        path = PROJECT_ROOT / entry
+        for p in (path.rglob("*") if path.is_dir() else [path]):
+            try:
+                if p.stat().st_mtime_ns > built:
+                    return False
+            except FileNotFoundError:
+                continue
+    return True
 
 
 def build_local(runner: TestRunner) -> bool:
     """Build sy locally."""
     log_header("Building locally")
 
-    ok = runner.run("Build sy", ["cargo", "build", "--release", "--bin", "sy"])
-    ok = runner.run("Build sy-remote", ["cargo", "build", "--release", "--bin", "sy-remote"]) and ok
+    binaries = [SY_BIN, PROJECT_ROOT / "target/release/sy-remote"]
+    if binaries_fresh(binaries):
+        log_info("Release binaries are newer than all sources")
+        return True
+
+    head = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        capture_output=True, text=True, cwd=PROJECT_ROOT
+    ).stdout.strip()
+    dirty = subprocess.run(
+        ["git", "status", "--porcelain", "--", *BUILD_INPUTS],
+        capture_output=True, text=True, cwd=PROJECT_ROOT
+    ).stdout.strip()
+    # Only a clean tree is fully described by its commit
+    key = head if head and not dirty else None
+
+    stamp = PROJECT_ROOT / BUILD_STAMP
+    if key:
+        try:
+            # The stamp only vouches for binaries no newer than itself; a
+            # later manual cargo build may have replaced them
+            stamped = stamp.stat().st_mtime_ns
+            if (stamped >= max(b.stat().st_mtime_ns for b in binaries)
+                    and stamp.read_text().strip() == key):
+                log_info(f"Release binaries already built from {key[:12]}")
+                return True
+        except OSError:
+            pass
+
+    stamp.unlink(missing_ok=True)
+    ok = runner.run(
+        "Build sy + sy-remote",
+        ["cargo", "build", "--release", "--bin", "sy", "--bin", "sy-remote"],
+        env=cargo_env(),
+    )
+    if ok and key:
+        stamp.write_text(key + "\n")
     return ok
 
 
-def build_fedora(runner: TestRunner) -> bool:
+def build_fedora(runner: TestRunner, branch: str) -> bool:
     """Build sy-remote on Fedora."""
     log_header("Building on Fedora")
 
-    branch = subprocess.run(
-        ["git", "branch", "--show-current"],
-        capture_output=True, text=True, cwd=PROJECT_ROOT
-    ).stdout.strip()
-
     log_info(f"Syncing branch: {branch}")
 
     # Sync repo on Fedora
@@ -241,10 +527,32 @@ def build_fedora(runner: TestRunner) -> bool:
     if not ok:
         return False
 
+    # Skip the build if the installed sy-remote came from this commit: the
+    # stamp must match HEAD and be no older than the binaries it vouches for
+    installed = "${CARGO_HOME:-$HOME/.cargo}/bin/sy-remote"
+    try:
+        check = subprocess.run(
+            ["ssh", *runner.ssh_options(), f"{FEDORA_USER}@{FEDORA_HOST}",
+             f"cd {FEDORA_REPO} && git rev-parse HEAD && cat {BUILD_STAMP} && "
+             f"[ -e {installed} ] && ! [ {installed} -nt {BUILD_STAMP} ] && "
+             f"! [ target/release/sy-remote -nt {BUILD_STAMP} ]"],
+            capture_output=True, text=True, timeout=30
+        )
+        lines = check.stdout.split() if check.returncode == 0 else []
+    except subprocess.TimeoutExpired:
+        lines = []
+    if len(lines) == 2 and lines[0] == lines[1]:
+        log_info(f"sy-remote already built from {lines[0][:12]}")
+        return True
+
+    remote_cargo = (f"cd {FEDORA_REPO} && rm -f {BUILD_STAMP} && "
+                    "if command -v sccache >/dev/null; then "
+                    "export RUSTC_WRAPPER=sccache CARGO_INCREMENTAL=0; fi && cargo")
+
     # Build sy-remote
     ok = runner.run_ssh(
         "Build sy-remote (Fedora)",
-        f"cd {FEDORA_REPO} && cargo build --release --bin sy-remote"
+        f"{remote_cargo} build --release --bin sy-remote"
     )
     if not ok:
         return False
@@ -252,41 +560,55 @@ def build_fedora(runner: TestRunner) -> bool:
     # Install to PATH
     ok = runner.run_ssh(
         "Install sy-remote",
-        f"cd {FEDORA_REPO} && cargo install --path . --bin sy-remote --force"
+        f"{remote_cargo} install --path . --bin sy-remote --force && "
+        f"git rev-parse HEAD > {BUILD_STAMP}"
     )
     return ok
 
 
+def cargo_test(runner: TestRunner, name: str, cargo_args: list[str],
+               ignored: bool = False, timeout: int = 300,
+               threads: int = TEST_THREADS) -> bool:
+    """Run `cargo test`, reporting every failure rather than the first."""
+    test_args = ["--ignored"] if ignored else []
+    return runner.run(
+        name,
+        ["cargo", "test", "--no-fail-fast", *cargo_args,
+         "--", *test_args, f"--test-threads={threads}"],
+        timeout=timeout
+    )
+
+
 def test_local_unit(runner: TestRunner) -> bool:
     """Run local unit and integration tests."""
     log_header("Local Tests")
-    return runner.run("Unit/integration tests", ["cargo", "test"], timeout=180)
+    return cargo_test(runner, "Unit/integration tests", [], timeout=180)
 
 
 def test_local_large(runner: TestRunner) -> bool:
     """Run large-scale local tests."""
     log_header("Large-Scale Tests")
 
-    ok = runner.run(
-        "Massive directory tests",
-        ["cargo", "test", "--test", "massive_directory_test", "--", "--ignored"],
-        timeout=600
+    # One cargo invocation for both suites
+    return cargo_test(
+        runner,
+        "Massive directory + large file tests",
+        ["--test", "massive_directory_test", "--test", "large_file_test"],
+        ignored=True,
+        timeout=900
     )
-    ok = runner.run(
-        "Large file tests",
-        ["cargo", "test", "--test", "large_file_test", "--", "--ignored"],
-        timeout=300
-    ) and ok
-    return ok
 
 
 def test_ssh_comprehensive(runner: TestRunner) -> bool:
     """Run SSH comprehensive tests."""
     log_header("SSH Comprehensive Tests")
-    return runner.run(
+    return cargo_test(
+        runner,
         "SSH comprehensive",
-        ["cargo", "test", "--test", "ssh_comprehensive_test", "--", "--ignored"],
-        timeout=300
+        ["--test", "ssh_comprehensive_test"],
+        ignored=True,
+        timeout=300,
+        threads=SHARED_TEST_THREADS if runner.jobs > 1 else TEST_THREADS
     )
 
 
@@ -294,24 +616,10 @@ def test_cross_filesystem(runner: TestRunner) -> bool:
     """Test cross-filesystem sync (APFS ↔ ext4)."""
     log_header("Cross-Filesystem Tests")
 
-    import tempfile
-
     with tempfile.TemporaryDirectory() as tmpdir:
         local_src = Path(tmpdir) / "src"
         local_src.mkdir()
-
-        # Create test files with various attributes
-        (local_src / "regular.txt").write_text("hello world")
-        (local_src / "empty.txt").write_text("")
-        (local_src / "subdir").mkdir()
-        (local_src / "subdir" / "nested.txt").write_text("nested content")
-
-        # Binary file
-        (local_src / "binary.bin").write_bytes(bytes(range(256)))
-
-        # File with spaces and special chars
-        (local_src / "file with spaces.txt").write_text("spaces")
-        (local_src / "special!@#.txt").write_text("special")
+        build_cross_fs_fixture(local_src)
 
         remote_dest = "/tmp/sy-cross-fs-test"
         local_roundtrip = Path(tmpdir) / "roundtrip"
@@ -335,20 +643,36 @@ def test_cross_filesystem(runner: TestRunner) -> bool:
             return False
 
         # Verify roundtrip integrity
-        import filecmp
-        import os
-
-        match, mismatch, errors = filecmp.cmpfiles(
-            local_src, local_roundtrip,
-            [f.name for f in local_src.iterdir() if f.is_file()],
-            shallow=False
-        )
+        with os.scandir(local_src) as entries:
+            src_sizes = {e.name: e.stat(follow_symlinks=False).st_size
+                         for e in entries if e.is_file(follow_symlinks=False)}
+
+        errors, mismatch, same_size = [], [], []
+        for name, size in src_sizes.items():
+            try:
+                dst_size = (local_roundtrip / name).stat().st_size
+            except OSError:
+                errors.append(name)
+                continue
+            # A size difference is a mismatch without reading either file
+            (same_size if dst_size == size else mismatch).append(name)
+
+        prefetch([local_src / n for n in same_size] + [local_roundtrip / n for n in same_size])
+
+        # Hashing releases the GIL, so fan out
+        with ThreadPoolExecutor() as pool:
+            src_digests = list(pool.map(file_digest, [local_src / n for n in same_size]))
+            dst_digests = list(pool.map(file_digest, [local_roundtrip / n for n in same_size]))
+
+        errors += [n for n, d in zip(same_size, dst_digests) if d is None]
+        mismatch += [n for n, s, d in zip(same_size, src_digests, dst_digests)
+                     if d is not None and s != d]
 
         if mismatch or errors:
             log_error(f"Roundtrip mismatch: {mismatch}, errors: {errors}")
             return False
 
-        log_success(f"Roundtrip verified: {len(match)} files match")
+        log_success(f"Roundtrip verified: {len(src_sizes)} files match")
 
         # Cleanup remote
         runner.run_ssh("Cleanup remote", f"rm -rf {remote_dest}")
@@ -360,8 +684,6 @@ def test_real_world_scenarios(runner: TestRunner) -> bool:
     """Test real-world sync scenarios."""
     log_header("Real-World Scenarios")
 
-    import tempfile
-
     with tempfile.TemporaryDirectory() as tmpdir:
         src = Path(tmpdir) / "src"
         dst = Path(tmpdir) / "dst"
@@ -370,10 +692,7 @@ def test_real_world_scenarios(runner: TestRunner) -> bool:
 
         # Scenario 1: Git repository sync
         log_info("Scenario: Git repository")
-        subprocess.run(["git", "init"], cwd=src, capture_output=True)
-        (src / "README.md").write_text("# Test")
-        (src / ".gitignore").write_text("*.log\n")
-        (src / "debug.log").write_text("should be ignored with --gitignore")
+        build_git_fixture(src)
 
         ok = runner.run(
             "Git repo (include all)",
@@ -412,11 +731,30 @@ def test_real_world_scenarios(runner: TestRunner) -> bool:
         # Scenario 3: Idempotent sync
         log_info("Scenario: Idempotent sync")
 
+        resync = [str(SY_BIN), str(src) + "/", str(dst), "--exclude-vcs"]
         result = subprocess.run(
-            [str(SY_BIN), str(src) + "/", str(dst), "--exclude-vcs"],
+            resync + ["--json"],
             capture_output=True, text=True, cwd=PROJECT_ROOT
         )
-        if "Files skipped:" not in result.stdout:
+        # The summary event is the last line of the NDJSON stream
+        skipped = None
+        for line in reversed(result.stdout.splitlines()):
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict) and event.get("type") == "summary":
+                skipped = event.get("files_skipped", 0)
+                break
+
+        if skipped is None:
+            # Older binary without --json: check the human-readable summary
+            result = subprocess.run(
+                resync, capture_output=True, text=True, cwd=PROJECT_ROOT
+            )
+            skipped = "Files skipped:" in result.stdout
+
+        if not skipped:
             log_warn("Expected files to be skipped on re-sync")
 
         return ok
@@ -427,9 +765,10 @@ def test_performance_baselines(runner: TestRunner) -> bool:
     log_header("Performance Baselines")
 
     # Run the performance regression tests
-    ok = runner.run(
+    ok = cargo_test(
+        runner,
         "Performance regression suite",
-        ["cargo", "test", "--test", "performance_test", "--release"],
+        ["--test", "performance_test", "--release"],
         timeout=120
     )
 
@@ -440,16 +779,10 @@ def test_cli_flag_combinations(runner: TestRunner) -> bool:
     """Test various CLI flag combinations."""
     log_header("CLI Flag Combinations")
 
-    import tempfile
-
     with tempfile.TemporaryDirectory() as tmpdir:
         src = Path(tmpdir) / "src"
-        dst = Path(tmpdir) / "dst"
         src.mkdir()
-
-        # Create test files
-        (src / "file1.txt").write_text("content1")
-        (src / "file2.txt").write_text("content2")
+        build_cli_fixture(src)
 
         flag_combos = [
             (["--dry-run"], "Dry run"),
@@ -460,19 +793,19 @@ def test_cli_flag_combinations(runner: TestRunner) -> bool:
             (["--ignore-times"], "Ignore times"),
         ]
 
-        all_ok = True
+        # All combos share one source; set up every destination before
+        # dispatching so the workers do nothing but run sy
+        combos = []
         for flags, name in flag_combos:
             dst_path = Path(tmpdir) / f"dst_{name.replace(' ', '_')}"
             dst_path.mkdir(exist_ok=True)
+            combos.append((f"CLI: {name}", [str(SY_BIN), str(src) + "/", str(dst_path)] + flags))
 
-            ok = runner.run(
-                f"CLI: {name}",
-                [str(SY_BIN), str(src) + "/", str(dst_path)] + flags,
-                timeout=30
-            )
-            all_ok = all_ok and ok
-
-        return all_ok
+        results = run_parallel(
+            runner.jobs,
+            [lambda n=name, c=cmd: runner.run(n, c, timeout=30) for name, cmd in combos],
+        )
+        return all(results)
 
 
 # ============================================================================
@@ -486,9 +819,17 @@ def main():
     parser.add_argument("-s", "--skip-build", action="store_true", help="Skip cargo builds")
     parser.add_argument("--local-only", action="store_true", help="Skip SSH/remote tests")
     parser.add_argument("--perf", action="store_true", help="Run performance baselines")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Run up to N independent tests concurrently "
+                             "(default: 1; output of concurrent groups interleaves)")
     args = parser.parse_args()
 
-    runner = TestRunner(verbose=args.verbose)
+    runner = TestRunner(verbose=args.verbose, jobs=args.jobs)
+
+    branch = subprocess.run(
+        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+        capture_output=True, text=True, cwd=PROJECT_ROOT
+    ).stdout.strip()
 
     log_header("sy Cross-Platform Test Suite")
     if args.large:
@@ -517,11 +858,13 @@ def main():
     if args.perf:
         test_performance_baselines(runner)
 
-    # CLI flag combinations
-    test_cli_flag_combinations(runner)
-
-    # Real-world scenarios
-    test_real_world_scenarios(runner)
+    # CLI flag combinations and real-world scenarios use their own tempdirs,
+    # so with --jobs > 1 they run concurrently with each other and with the
+    # remote tests
+    tasks = [
+        lambda: test_cli_flag_combinations(runner),
+        lambda: test_real_world_scenarios(runner),
+    ]
 
     # SSH/remote tests
     if not args.local_only:
@@ -530,21 +873,24 @@ def main():
         if not check_ssh_connection(runner):
             log_warn("SSH not available - skipping remote tests")
         else:
-            if not args.skip_build:
-                build_fedora(runner)
+            def remote_tests() -> bool:
+                if not args.skip_build:
+                    build_fedora(runner, branch)
 
-            test_ssh_comprehensive(runner)
-            test_cross_filesystem(runner)
+                return all(run_parallel(args.jobs, [
+                    lambda: test_ssh_comprehensive(runner),
+                    lambda: test_cross_filesystem(runner),
+                ]))
+
+            tasks.append(remote_tests)
+
+    run_parallel(args.jobs, tasks)
 
     # Summary
     print()
     success = runner.summary()
 
     if success:
-        branch = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True, text=True, cwd=PROJECT_ROOT
-        ).stdout.strip()
         print()
         log_info(f"Branch '{branch}' is ready for CI")
 